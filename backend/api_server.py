@@ -1,4 +1,4 @@
-from fastapi import FastAPI, HTTPException, Query, Depends, WebSocket, WebSocketDisconnect, BackgroundTasks, File, UploadFile, Form
+from fastapi import FastAPI, HTTPException, Query, Depends, WebSocket, WebSocketDisconnect, BackgroundTasks, File, UploadFile, Form, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
@@ -18,6 +18,7 @@ from sqlalchemy.orm import selectinload
 from sqlalchemy import select
 from contextlib import asynccontextmanager
 import importlib.metadata
+import uuid
 
 from tyler.models.thread import Thread
 from tyler.models.message import Message, Attachment
@@ -25,7 +26,8 @@ from tyler.models.agent import Agent
 from tyler.database.thread_store import ThreadStore
 from tyler.storage import FileStore
 from tyler.mcp.utils import initialize_mcp_service, cleanup_mcp_service
-from utils.config_loader import load_mcp_config
+from utils.config_loader import load_mcp_config, load_db_config
+from utils.db_pool import PoolMonitor, ThreadStoreRouter, get_store_engine
 
 logger = logging.getLogger(__name__)
 
@@ -96,6 +98,31 @@ class FileStorageConfig(BaseModel):
     mount_path: str
     storage_basename: str  # The basename of the storage path, used for link detection
 
+class PoolStats(BaseModel):
+    role: str  # "primary" or "replica"
+    pool_class: str
+    pool_size: Optional[int] = None
+    max_overflow: Optional[int] = None
+    checked_out: Optional[int] = None
+    checked_in: Optional[int] = None
+    overflow: Optional[int] = None
+    utilization: Optional[float] = None  # Checked out connections / (pool_size + max_overflow)
+    checkouts: int
+    timeouts: int
+    avg_wait_ms: float
+    max_wait_ms: float
+
+class ReadRoutingStats(BaseModel):
+    replica_enabled: bool
+    read_your_writes_seconds: float
+    primary_reads: int
+    replica_reads: int
+    sticky_keys: int
+
+class DatabaseMetrics(BaseModel):
+    pools: List[PoolStats]
+    read_routing: ReadRoutingStats
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan context manager for database and file store initialization."""
@@ -142,30 +169,41 @@ async def lifespan(app: FastAPI):
     # Initialize ThreadStore with factory pattern
     logger.info("Initializing thread store...")
     global thread_store
+    global db_router
+    global pool_monitors
     
-    # Construct database URL from individual environment variables
-    db_type = os.getenv("TYLER_DB_TYPE")
-    if db_type == "postgresql":
-        db_host = os.getenv("TYLER_DB_HOST", "localhost")
-        db_port = os.getenv("TYLER_DB_PORT", "5432")
-        db_name = os.getenv("TYLER_DB_NAME", "tyler")
-        db_user = os.getenv("TYLER_DB_USER", "tyler")
-        db_password = os.getenv("TYLER_DB_PASSWORD", "tyler_dev")
-        database_url = f"postgresql+asyncpg://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}"
-        logger.info(f"Constructed PostgreSQL database URL from environment variables")
-    elif db_type == "sqlite":
-        db_path = os.getenv("TYLER_DB_PATH", "tyler.db")
-        database_url = f"sqlite+aiosqlite:///{db_path}"
-        logger.info(f"Constructed SQLite database URL from environment variables")
-    else:
-        # Default to in-memory if no valid DB type specified
-        database_url = None
-        logger.info("No valid database type specified, using in-memory storage")
+    # Construct database URLs and pool settings from individual environment variables
+    db_config = load_db_config()
     
     # Create thread store with constructed database URL
-    thread_store = await ThreadStore.create(database_url)
+    thread_store = await ThreadStore.create(db_config["database_url"])
     logger.info(f"Thread store initialized successfully with database URL: {thread_store.database_url or 'in-memory'}")
     
+    # Create a second thread store for read-only endpoints if a read replica is configured
+    replica_store = None
+    if db_config["replica_url"]:
+        replica_store = await ThreadStore.create(db_config["replica_url"])
+        logger.info("Read replica thread store initialized successfully")
+    
+    db_router = ThreadStoreRouter(
+        primary=thread_store,
+        replica=replica_store,
+        read_your_writes_seconds=db_config["read_your_writes_seconds"]
+    )
+    
+    pool_monitors = []
+    for role, store in (("primary", thread_store), ("replica", replica_store)):
+        engine = get_store_engine(store) if store else None
+        if engine is not None:
+            pool_monitors.append(PoolMonitor(role, engine))
+    for monitor in pool_monitors:
+        # Log what the engine actually uses, since Tyler only applies TYLER_DB_POOL_* for PostgreSQL
+        pool_stats = monitor.stats()
+        logger.info(
+            f"Database {monitor.role} pool: {pool_stats['pool_class']}, "
+            f"pool_size={pool_stats['pool_size']}, max_overflow={pool_stats['max_overflow']}"
+        )
+    
     # Initialize MCP service if we have configurations
     global mcp_service
     global available_tools
@@ -236,9 +274,32 @@ app.add_middleware(
     max_age=600  # Cache preflight requests for 10 minutes
 )
 
+@app.middleware("http")
+async def track_database_writes(request: Request, call_next):
+    """Keep reads from this client and thread on the primary database right after a write"""
+    if db_router is None or db_router.replica is None:
+        return await call_next(request)
+    
+    client_id = request.cookies.get(DB_CLIENT_COOKIE)
+    is_new_client = client_id is None
+    if is_new_client:
+        client_id = uuid.uuid4().hex
+    request.state.db_client_id = client_id
+    
+    response = await call_next(request)
+    if request.method in ("POST", "PUT", "PATCH", "DELETE"):
+        db_router.mark_written(thread_id=request.path_params.get("thread_id"), client=client_id)
+    if is_new_client:
+        response.set_cookie(DB_CLIENT_COOKIE, client_id, httponly=True, samesite="lax")
+    return response
+
 # Declare thread_store variable that will be initialized in lifespan
 thread_store = None
 
+# Read/write router and pool monitors, initialized in lifespan alongside thread_store
+db_router = None
+pool_monitors = []
+
 # Declare file_store variable that will be initialized in lifespan
 file_store = None
 
@@ -271,6 +332,20 @@ agent = None
 async def get_thread_store():
     return thread_store
 
+# Cookie identifying a browser for read-your-writes routing. The API is usually reached
+# through the Vite dev proxy or a reverse proxy, so the peer address can't tell clients apart.
+DB_CLIENT_COOKIE = "tyler_client_id"
+
+def get_db_client_id(request: Request) -> Optional[str]:
+    return getattr(request.state, "db_client_id", None)
+
+# Dependencies to get the thread store for read-only endpoints (may be a read replica)
+async def get_read_thread_store(request: Request):
+    return db_router.reader(client=get_db_client_id(request))
+
+async def get_thread_read_store(thread_id: str, request: Request):
+    return db_router.reader(thread_id=thread_id, client=get_db_client_id(request))
+
 # Store active WebSocket connections
 class ConnectionManager:
     def __init__(self):
@@ -335,7 +410,7 @@ async def create_thread(
 async def list_threads(
     limit: int = Query(30, ge=1, le=100),
     offset: int = Query(0, ge=0),
-    thread_store: ThreadStore = Depends(get_thread_store)
+    thread_store: ThreadStore = Depends(get_read_thread_store)
 ):
     """List threads with pagination"""
     return await thread_store.list(limit=limit, offset=offset)
@@ -343,7 +418,7 @@ async def list_threads(
 @app.get("/threads/{thread_id}", response_model=Thread)
 async def get_thread(
     thread_id: str,
-    thread_store: ThreadStore = Depends(get_thread_store)
+    thread_store: ThreadStore = Depends(get_thread_read_store)
 ):
     """Get a specific thread by ID"""
     thread = await thread_store.get(thread_id)
@@ -513,6 +588,10 @@ async def generate_and_save_title(thread_id: str, thread_store: ThreadStore, man
             thread_store=thread_store
         )
         
+        # This write happens outside a request, so mark the thread for read-your-writes here
+        if db_router is not None:
+            db_router.mark_written(thread_id=thread_id)
+        
         # Broadcast the update
         await manager.broadcast_title_update(thread_id, updated_thread)
         print("Title saved and broadcasted")
@@ -520,7 +599,7 @@ async def generate_and_save_title(thread_id: str, thread_store: ThreadStore, man
 @app.get("/threads/search/attributes")
 async def search_threads_by_attributes(
     attributes: Dict[str, Any],
-    thread_store: ThreadStore = Depends(get_thread_store)
+    thread_store: ThreadStore = Depends(get_read_thread_store)
 ):
     """Search threads by attributes"""
     return await thread_store.find_by_attributes(attributes)
@@ -529,7 +608,7 @@ async def search_threads_by_attributes(
 async def search_threads_by_source(
     source_name: str,
     properties: Dict[str, Any],
-    thread_store: ThreadStore = Depends(get_thread_store)
+    thread_store: ThreadStore = Depends(get_read_thread_store)
 ):
     """Search threads by source name and properties"""
     return await thread_store.find_by_source(source_name, properties)
@@ -564,6 +643,21 @@ async def get_version_info(
         is_compatible=is_compatible
     )
 
+@app.get("/metrics/db", response_model=DatabaseMetrics)
+async def get_database_metrics():
+    """
+    Get database connection pool and read routing metrics.
+    
+    Reports pool utilization and connection wait times for the primary database
+    and, if configured, the read replica. Pools are only listed for SQL storage.
+    """
+    if db_router is None:
+        raise HTTPException(status_code=503, detail="Database is not initialized")
+    return DatabaseMetrics(
+        pools=[PoolStats(**monitor.stats()) for monitor in pool_monitors],
+        read_routing=ReadRoutingStats(**db_router.stats())
+    )
+
 @app.get("/config/file-storage", response_model=FileStorageConfig)
 async def get_file_storage_config():
     """
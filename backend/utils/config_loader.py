@@ -3,7 +3,7 @@ Configuration loader utilities for the API server.
 """
 import os
 import yaml
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -67,4 +67,92 @@ def load_mcp_config() -> List[Dict[str, Any]]:
         return []
     except Exception as e:
         logger.error(f"Unexpected error loading MCP config: {e}")
-        return [] 
\ No newline at end of file
+        return []
+
+def _get_int_env(name: str, default: Optional[int], minimum: int = 0) -> Optional[int]:
+    """Read an integer environment variable, falling back to the default when unset."""
+    value = os.getenv(name)
+    if value is None or value.strip() == "":
+        return default
+    try:
+        parsed = int(value)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer, got '{value}'") from None
+    if parsed < minimum:
+        raise ValueError(f"{name} must be >= {minimum}, got {parsed}")
+    return parsed
+
+def _get_float_env(name: str, default: float, minimum: float = 0.0) -> float:
+    """Read a float environment variable, falling back to the default when unset."""
+    value = os.getenv(name)
+    if value is None or value.strip() == "":
+        return default
+    try:
+        parsed = float(value)
+    except ValueError:
+        raise ValueError(f"{name} must be a number, got '{value}'") from None
+    if parsed < minimum:
+        raise ValueError(f"{name} must be >= {minimum}, got {parsed}")
+    return parsed
+
+def load_db_config() -> Dict[str, Any]:
+    """
+    Load database connection settings from TYLER_DB_* environment variables.
+    
+    Pool settings are applied by Tyler's SQL backend, which reads them from the
+    environment itself (PostgreSQL only). They are validated here so a bad value
+    fails at startup; unset values are None and keep Tyler's defaults.
+    
+    Returns:
+        Dict[str, Any]: A dict with the primary ``database_url`` (None for in-memory
+                        storage), an optional ``replica_url`` for read-only traffic,
+                        the ``pool`` settings, ``statement_cache_size`` and
+                        ``read_your_writes_seconds``.
+    """
+    pool = {
+        "pool_size": _get_int_env("TYLER_DB_POOL_SIZE", None, minimum=1),
+        "max_overflow": _get_int_env("TYLER_DB_MAX_OVERFLOW", None, minimum=-1),
+        "pool_timeout": _get_int_env("TYLER_DB_POOL_TIMEOUT", None),
+        "pool_recycle": _get_int_env("TYLER_DB_POOL_RECYCLE", None, minimum=-1),
+    }
+    statement_cache_size = _get_int_env("TYLER_DB_STATEMENT_CACHE_SIZE", 100)
+    read_your_writes_seconds = _get_float_env("TYLER_DB_READ_YOUR_WRITES_SECONDS", 5.0)
+    
+    database_url = None
+    replica_url = None
+    
+    db_type = os.getenv("TYLER_DB_TYPE")
+    if db_type == "postgresql":
+        db_host = os.getenv("TYLER_DB_HOST", "localhost")
+        db_port = os.getenv("TYLER_DB_PORT", "5432")
+        db_name = os.getenv("TYLER_DB_NAME", "tyler")
+        db_user = os.getenv("TYLER_DB_USER", "tyler")
+        db_password = os.getenv("TYLER_DB_PASSWORD", "tyler_dev")
+        
+        # Size of SQLAlchemy's per-connection prepared statement cache for asyncpg
+        query = f"?prepared_statement_cache_size={statement_cache_size}"
+        database_url = f"postgresql+asyncpg://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}{query}"
+        logger.info("Constructed PostgreSQL database URL from environment variables")
+        
+        replica_host = os.getenv("TYLER_DB_REPLICA_HOST")
+        if replica_host:
+            replica_port = os.getenv("TYLER_DB_REPLICA_PORT", db_port)
+            replica_url = f"postgresql+asyncpg://{db_user}:{db_password}@{replica_host}:{replica_port}/{db_name}{query}"
+            logger.info("Constructed PostgreSQL read replica URL from environment variables")
+    elif db_type == "sqlite":
+        db_path = os.getenv("TYLER_DB_PATH", "tyler.db")
+        database_url = f"sqlite+aiosqlite:///{db_path}"
+        logger.info("Constructed SQLite database URL from environment variables")
+        if os.getenv("TYLER_DB_REPLICA_HOST"):
+            logger.warning("TYLER_DB_REPLICA_HOST is only supported for PostgreSQL, ignoring it")
+    else:
+        # Default to in-memory if no valid DB type specified
+        logger.info("No valid database type specified, using in-memory storage")
+    
+    return {
+        "database_url": database_url,
+        "replica_url": replica_url,
+        "pool": pool,
+        "statement_cache_size": statement_cache_size,
+        "read_your_writes_seconds": read_your_writes_seconds,
+    }
@@ -0,0 +1,142 @@
+"""
+Database connection pool monitoring and read/write routing for the API server.
+"""
+import time
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+from sqlalchemy import exc as sa_exc
+
+from tyler.database.thread_store import ThreadStore
+
+logger = logging.getLogger(__name__)
+
+def get_store_engine(store: ThreadStore):
+    """Return the SQLAlchemy async engine behind a thread store, or None for in-memory storage."""
+    engine = getattr(store, "engine", None)
+    if engine is None:
+        engine = getattr(getattr(store, "_backend", None), "engine", None)
+    return engine
+
+class PoolMonitor:
+    """
+    Tracks connection pool utilization and checkout wait times for one engine.
+
+    Wait time is measured around ``Engine.raw_connection``, so it covers both waiting
+    for a free pooled connection and opening a new one when the pool has to grow.
+    """
+    def __init__(self, role: str, engine):
+        self.role = role
+        self.engine = engine
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self._instrument()
+
+    def _instrument(self):
+        sync_engine = self.engine.sync_engine
+        raw_connection = sync_engine.raw_connection
+
+        def timed_raw_connection(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return raw_connection(*args, **kwargs)
+            except sa_exc.TimeoutError:
+                self.timeouts += 1
+                logger.warning(f"Timed out waiting for a connection from the {self.role} database pool")
+                raise
+            finally:
+                waited = time.perf_counter() - start
+                self.checkouts += 1
+                self.total_wait_seconds += waited
+                self.max_wait_seconds = max(self.max_wait_seconds, waited)
+
+        sync_engine.raw_connection = timed_raw_connection
+
+    def stats(self) -> Dict[str, Any]:
+        """Return a snapshot of the pool's current state and cumulative wait metrics."""
+        pool = self.engine.sync_engine.pool
+        # Only queue-based pools expose sizing; e.g. in-memory SQLite uses a StaticPool.
+        # QueuePool has no public accessor for its overflow limit, and -1 means unlimited.
+        has_sizing = all(hasattr(pool, name) for name in ("size", "checkedout", "checkedin", "overflow"))
+        pool_size = pool.size() if has_sizing else None
+        max_overflow = getattr(pool, "_max_overflow", None) if has_sizing else None
+        checked_out = pool.checkedout() if has_sizing else None
+        capacity = pool_size + max_overflow if max_overflow is not None and max_overflow >= 0 else None
+        return {
+            "role": self.role,
+            "pool_class": type(pool).__name__,
+            "pool_size": pool_size,
+            "max_overflow": max_overflow,
+            "checked_out": checked_out,
+            "checked_in": pool.checkedin() if has_sizing else None,
+            "overflow": pool.overflow() if has_sizing else None,
+            "utilization": checked_out / capacity if capacity else None,
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "avg_wait_ms": (self.total_wait_seconds / self.checkouts) * 1000 if self.checkouts else 0.0,
+            "max_wait_ms": self.max_wait_seconds * 1000,
+        }
+
+class ThreadStoreRouter:
+    """
+    Routes read-only queries to a replica thread store when one is configured.
+
+    Reads stick to the primary for ``read_your_writes_seconds`` after a write by the
+    same client or to the same thread, so callers never read data older than their
+    own writes while the replica catches up. This state lives in the current process,
+    so stickiness only holds when the server runs with a single worker.
+    """
+    def __init__(self, primary: ThreadStore, replica: Optional[ThreadStore] = None, read_your_writes_seconds: float = 5.0):
+        self.primary = primary
+        self.replica = replica
+        self.read_your_writes_seconds = read_your_writes_seconds
+        self.primary_reads = 0
+        self.replica_reads = 0
+        # Keys ordered by last write time so expired entries can be dropped from the front
+        self._recent_writes: "OrderedDict[Hashable, float]" = OrderedDict()
+
+    def mark_written(self, thread_id: Optional[str] = None, client: Optional[str] = None):
+        """Record a write so follow-up reads for this thread or client use the primary."""
+        if self.replica is None:
+            return
+        now = time.monotonic()
+        for key in (("thread", thread_id), ("client", client)):
+            if key[1] is None:
+                continue
+            self._recent_writes.pop(key, None)
+            self._recent_writes[key] = now
+        self._expire(now)
+
+    def reader(self, thread_id: Optional[str] = None, client: Optional[str] = None) -> ThreadStore:
+        """Return the store to use for a read-only query."""
+        if self.replica is None:
+            self.primary_reads += 1
+            return self.primary
+        now = time.monotonic()
+        self._expire(now)
+        if ("thread", thread_id) in self._recent_writes or ("client", client) in self._recent_writes:
+            self.primary_reads += 1
+            return self.primary
+        self.replica_reads += 1
+        return self.replica
+
+    def _expire(self, now: float):
+        cutoff = now - self.read_your_writes_seconds
+        while self._recent_writes:
+            key, written_at = next(iter(self._recent_writes.items()))
+            if written_at > cutoff:
+                break
+            self._recent_writes.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return read routing counters."""
+        return {
+            "replica_enabled": self.replica is not None,
+            "read_your_writes_seconds": self.read_your_writes_seconds,
+            "primary_reads": self.primary_reads,
+            "replica_reads": self.replica_reads,
+            "sticky_keys": len(self._recent_writes),
+        }